@@ -4,15 +4,16 @@ sui
 
 The user interface for Conway's Game of Life.
 """
+import sys
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from importlib.resources import files
 from importlib.resources.abc import Traversable
 from pathlib import Path
 from time import sleep
-from typing import Sequence, Union
+from typing import TYPE_CHECKING, Sequence, Union
 
 import numpy as np
-from blessed import Terminal
 from numpy.typing import NDArray
 
 import life.pattern
@@ -21,6 +22,11 @@ from life.codec import codecs, decode, encode
 from life.life import Grid, InvalidRule
 
 
+# blessed is only imported when a terminal is needed.
+if TYPE_CHECKING:
+    from blessed import Terminal
+
+
 # Types.
 Command = tuple[str] | tuple[str, str]
 
@@ -35,6 +41,11 @@ SUP = '\x1b[1;2A'
 SLEFT = '\x1b[1;2D'
 SRIGHT = '\x1b[1;2C'
 
+# Characters for drawing two rows of cells in one line of the
+# terminal, indexed by the state of the top cell times two plus
+# the state of the bottom cell.
+BLOCKS = np.array([' ', '\u2584', '\u2580', '\u2588'])
+
 
 # Exceptions.
 class CannotTakeInput(NotImplementedError):
@@ -45,6 +56,31 @@ class InvalidSaveFormat(ValueError):
     """The given save file format was invalid."""
 
 
+# Utility functions.
+@lru_cache(maxsize=None)
+def _get_terminal() -> 'Terminal':
+    """Get the shared terminal the UI runs in.
+
+    :returns: A :class:`blessed.Terminal` object.
+    :rtype: blessed.Terminal
+    """
+    from blessed import Terminal
+    return Terminal()
+
+
+@lru_cache(maxsize=1024)
+def _move(term: 'Terminal', y: int, x: int) -> str:
+    """Build the sequence to move the cursor in the terminal.
+
+    :param term: The terminal the sequence is for.
+    :param y: The row to move the cursor to.
+    :param x: The column to move the cursor to.
+    :returns: A :class:`str` object.
+    :rtype: str
+    """
+    return str(term.move(y, x))
+
+
 # Base class.
 class State(ABC):
     """An abstract base class for UI states.
@@ -73,7 +109,7 @@ class State(ABC):
     def __init__(
         self,
         data: Grid,
-        term: Terminal,
+        term: 'Terminal',
         origin_y: int | None = None,
         origin_x: int | None = None,
         pace: float = 0,
@@ -98,6 +134,28 @@ class State(ABC):
         self.show_generation = show_generation
         self.user = user
 
+        # What has already been drawn to the terminal, so redraws only
+        # need to send the parts of the UI that changed. The shadow
+        # holds the rows of the grid by line, and the chrome holds the
+        # rule, commands, and generation.
+        self._chrome: dict[str, str] = {}
+        self._shadow: dict[int, str] = {}
+
+        # The horizontal rule and the terminal size it was built for.
+        self._hline = ''
+        self._size: tuple[int, int] = (0, 0)
+        self._check_size()
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        """Make every command a :class:`Command` when the state is
+        defined, so input doesn't have to check each key press.
+        """
+        super().__init_subclass__(**kwargs)
+        cls.commands = {
+            key: (value,) if isinstance(value, str) else value
+            for key, value in cls.commands.items()
+        }
+
     @property
     def menu(self) -> str:
         return self._menu
@@ -128,62 +186,42 @@ class State(ABC):
     def wrap(self, value) -> None:
         self.data.wrap = value
 
-    def _char_for_state(self, top, bottom) -> str:
-        """Return the character to draw based on the state of the cell."""
-        if top and bottom:
-            return '\u2588'
-        elif top and not bottom:
-            return '\u2580'
-        elif not top and bottom:
-            return '\u2584'
-        return ' '
+    def _check_size(self) -> None:
+        """Forget what is on the screen if the terminal has been
+        resized, since the whole UI has to be drawn again.
+        """
+        size = (self.term.height, self.term.width)
+        if size != self._size:
+            self._size = size
+            self._chrome.clear()
+            self._shadow.clear()
+            self._hline = '\u2500' * self.term.width
+
+    def _coalesce(self, cmd: Command) -> Command:
+        """Combine a movement command with any repeats of it already
+        waiting in the input, so a held key is handled in one step
+        rather than redrawing the UI for every press.
+        """
+        if len(cmd) != 2 or not isinstance(cmd[1], int):
+            return cmd
+        name, distance = cmd
+        with self.term.cbreak():
+            while key := self.term.inkey(timeout=0):
+                queued = self.commands.get(key)
+                if not queued or queued[0] != name:
+                    self.term.ungetch(key)
+                    break
+                distance += queued[1]
+        return (name, distance)
 
     def _draw_commands(self, cmds: str = '') -> None:
         """Draw the available commands."""
-        # y = -(self.data.height // -2) + 1
-        y = self.term.height - 2
-        print(
-            self.term.move(y, 0) + cmds + self.term.clear_eol,
-            end='',
-            flush=True
-        )
-
-    def _draw_generation(self) -> None:
-        """Draw the current generation to the terminal."""
-        if self.show_generation:
-            y = self.term.height - 3
-            print(
-                self.term.move(y, 0) + f'Generation: {self.data.generation}',
-                end='',
-                flush=True
-            )
+        self._write(self._render_commands(cmds))
 
     def _draw_prompt(self, msg: str = '> ') -> None:
         """Draw the command prompt."""
         y = self.term.height - 1
-        print(
-            self.term.move(y, 0) + msg + self.term.clear_eol,
-            end='',
-            flush=True
-        )
-
-    def _draw_rule(self) -> None:
-        """Draw the a horizontal rule."""
-        width = self.term.width
-        y = self.term.height - 3
-        print(self.term.move(y, 0) + '\u2500' * width)
-
-    def _draw_state(self) -> None:
-        """Draw the grid to the terminal."""
-        data: np.ndarray = self._get_window()
-        if len(data) % 2:
-            data = np.pad(data, ((0, 1), (0, 0)))
-        for i in range(0, len(data), 2):
-            cells = []
-            for j in range(0, len(data[i])):
-                char = self._char_for_state(data[i][j], data[i + 1][j])
-                cells.append(char)
-            print(self.term.move(i // 2, 0) + ''.join(cells))
+        self._write(_move(self.term, y, 0) + msg + self.term.clear_eol)
 
     def _expand_dir(self, path: str | Path) -> str:
         """Given the start of the name of a directory, if there is only
@@ -217,11 +255,8 @@ class State(ABC):
                     buffer += key
                 else:
                     buffer += key
-                print(
-                    self.term.move(y, x + x_text) + key,
-                    end='',
-                    flush=True
-                )
+                if key:
+                    self._write(_move(self.term, y, x + x_text) + key)
                 key = self.term.inkey()
         if key == ESC:
             return ESC
@@ -233,6 +268,75 @@ class State(ABC):
         shape = ((self.term.height - 3) * 2, self.term.width)
         return self.data.view(origin, shape)
 
+    def _render_chrome(self, key: str, text: str) -> str:
+        """Render a piece of the UI outside of the grid, unless it is
+        already on the screen.
+        """
+        if self._chrome.get(key) == text:
+            return ''
+        self._chrome[key] = text
+        return text
+
+    def _render_commands(self, cmds: str = '') -> str:
+        """Render the available commands."""
+        # y = -(self.data.height // -2) + 1
+        y = self.term.height - 2
+        text = _move(self.term, y, 0) + cmds + self.term.clear_eol
+        return self._render_chrome('commands', text)
+
+    def _render_generation(self) -> str:
+        """Render the current generation."""
+        if self.show_generation:
+            y = self.term.height - 3
+            gen = f'Generation: {self.data.generation}'
+            text = _move(self.term, y, 0) + gen
+            return self._render_chrome('generation', text)
+        return ''
+
+    def _render_rule(self) -> str:
+        """Render the a horizontal rule."""
+        y = self.term.height - 3
+        text = _move(self.term, y, 0) + self._hline
+        result = self._render_chrome('rule', text)
+
+        # The generation shares a line with the rule, so drawing the
+        # rule erases it.
+        if result:
+            self._chrome.pop('generation', None)
+        return result
+
+    def _render_state(self) -> str:
+        """Render the grid."""
+        data: np.ndarray = self._get_window()
+        if len(data) % 2:
+            data = np.pad(data, ((0, 1), (0, 0)))
+        index = data[::2].astype(np.uint8) * 2 + data[1::2]
+        lines = []
+        for y, cells in enumerate(BLOCKS[index]):
+            row = ''.join(cells)
+            if self._shadow.get(y) != row:
+                self._shadow[y] = row
+                lines.append(_move(self.term, y, 0) + row)
+        return ''.join(lines)
+
+    def _render_ui(self) -> str:
+        """Render the full UI for the state as a single string, so it
+        can be sent to the terminal in one write.
+        """
+        self._check_size()
+        return (
+            self._render_state()
+            + self._render_rule()
+            + self._render_commands(self.menu)
+        )
+
+    def _write(self, text: str) -> None:
+        """Send text to the terminal. All output from the UI goes
+        through here.
+        """
+        sys.stdout.write(text)
+        sys.stdout.flush()
+
     def asdict(self) -> dict:
         """Get the parameters of the state as a dictionary.
 
@@ -256,7 +360,7 @@ class State(ABC):
         :returns: A :class:`Command` object
         :rtype: Command
         """
-        cmd: Command | str | None = None
+        cmd: Command | None = None
         prompt = ''
         while not cmd:
             self._draw_prompt(prompt)
@@ -265,12 +369,13 @@ class State(ABC):
             try:
                 cmd = self.commands[raw_input]
             except KeyError:
-                self._draw_prompt('')
-                sleep(.05)
+                # Blank an existing error briefly, so the user can see
+                # a repeated error. A blank prompt needs no clearing.
+                if prompt:
+                    self._draw_prompt('')
+                    sleep(.05)
                 prompt = 'Invalid command. Please try again.'
-        if isinstance(cmd, str):
-            cmd = (cmd,)
-        return cmd
+        return self._coalesce(cmd)
 
     def update_ui(self) -> None:
         """Draw the UI for the edit state.
@@ -278,9 +383,9 @@ class State(ABC):
         :returns: `None`.
         :rtype: NoneType
         """
-        self._draw_state()
-        self._draw_rule()
-        self._draw_commands(self.menu)
+        text = self._render_ui()
+        if text:
+            self._write(text)
 
 
 # State classes.
@@ -375,13 +480,9 @@ class Autorun(State):
         :returns: A :class:`tuple` object.
         :rtype: tuple
         """
-        cmd = ('run',)
         with self.term.cbreak():
             raw_input = self.term.inkey(timeout=0.001)
-        if raw_input:
-            if raw_input in self.commands:
-                cmd = self.commands[raw_input]
-        return cmd
+        return self.commands.get(raw_input, ('run',))
 
     def run(self) -> 'Autorun':
         """Advance the generation of the grid.
@@ -449,14 +550,9 @@ class Autorun(State):
         self.pace += 0.01
         return self
 
-    def update_ui(self) -> None:
-        """Draw the UI for autorun state.
-
-        :returns: `None`.
-        :rtype: NoneType
-        """
-        super().update_ui()
-        self._draw_generation()
+    def _render_ui(self) -> str:
+        """Render the UI for autorun state."""
+        return super()._render_ui() + self._render_generation()
 
 
 class Config(State):
@@ -512,28 +608,29 @@ class Config(State):
             'wrap',
         ]
 
-    def _draw_state(self) -> None:
-        """Draw the configuration to the screen."""
+    def _render_state(self) -> str:
+        """Render the configuration settings."""
         height = self.term.height
 
+        lines = []
         for i, setting in enumerate(self.settings):
             label = setting.replace('_', ' ')
             value = getattr(self, setting)
-            line = str(self.term.move(i, 0))
+            line = _move(self.term, i, 0)
             if self.selected == i:
                 line += self.term.black_on_green
             line += f'{label.title()}: {value}' + self.term.clear_eol
             if self.selected == i:
                 line += self.term.normal
-            print(line, end='', flush=True)
+            lines.append(line)
 
-        if len(self.settings) < height:
-            for y in range(len(self.settings), height):
-                print(
-                    self.term.move(y, 0) + self.term.clear_eol,
-                    end='',
-                    flush=True
-                )
+        for y in range(len(self.settings), height):
+            lines.append(_move(self.term, y, 0) + self.term.clear_eol)
+
+        # The settings and the blank lines below them draw over the
+        # rule and the commands, so they need to be drawn again.
+        self._chrome.clear()
+        return ''.join(lines)
 
     def down(self) -> 'Config':
         """Command method. Select the next setting in the list.
@@ -724,9 +821,9 @@ class Core(State):
         """The text for the menu."""
         cmds = []
         for key in self.commands:
-            index = self.commands[key].index(key)
-            cmd = (f'{self.commands[key][0:index]}({key.upper()})'
-                   f'{self.commands[key][index + 1:]}')
+            name = self.commands[key][0]
+            index = name.index(key)
+            cmd = f'{name[0:index]}({key.upper()}){name[index + 1:]}'
             cmds.append(cmd)
         return ', '.join(cmds)
 
@@ -948,14 +1045,9 @@ class Core(State):
         """
         return Save(**self.asdict())
 
-    def update_ui(self) -> None:
-        """Draw the UI for the core state.
-
-        :returns: `None`.
-        :rtype: NoneType
-        """
-        super().update_ui()
-        self._draw_generation()
+    def _render_ui(self) -> str:
+        """Render the UI for the core state."""
+        return super()._render_ui() + self._render_generation()
 
 
 class Edit(State):
@@ -1019,22 +1111,45 @@ class Edit(State):
 
     # Private methods.
     def _draw_cursor(self):
-        """Display the cursor in the state UI."""
+        """Display the cursor and the grid under it in the state UI.
+        They are sent together, so the terminal gets a single write.
+        """
+        self._check_size()
+        self._write(self._render_state() + self._render_cursor())
+
+    def _move_cursor(self, d_row: int, d_col: int):
+        """Move the cursor and update the UI.
+
+        :param d_row: How much to change the row by.
+        :param d_col: How much to change the column by.
+        """
+        self.row += d_row
+        self.col += d_col
+        self.row = self.row % self.data.height
+        self.col = self.col % self.data.width
+        self._draw_cursor()
+
+    def _render_cursor(self) -> str:
+        """Render the cursor."""
         y = self.row // 2
 
+        # The cursor covers part of the row, so the row has to be
+        # redrawn once the cursor moves off of it.
+        self._shadow.pop(y, None)
+
         # Figure out whether either of the cells sharing the location
         # are alive.
         alive = []
         char = ''
         if self.row % 2:
             next_row = (self.row - 1) % self.data.height
-            alive.append(self.data[next_row][self.col])
-            alive.append(self.data[self.row][self.col])
+            alive.append(self.data[next_row, self.col])
+            alive.append(self.data[self.row, self.col])
             char = '\u2584'
         else:
             next_row = (self.row + 1) % self.data.height
-            alive.append(self.data[self.row][self.col])
-            alive.append(self.data[next_row][self.col])
+            alive.append(self.data[self.row, self.col])
+            alive.append(self.data[next_row, self.col])
             char = '\u2580'
 
         # Figure out which character and color is needed for the
@@ -1055,21 +1170,14 @@ class Edit(State):
         else:
             color = self.term.bright_green
 
-        print(self.term.move(y, self.col) + color + char
-              + self.term.bright_white_on_black)
-
-    def _move_cursor(self, d_row: int, d_col: int):
-        """Move the cursor and update the UI.
+        return (
+            _move(self.term, y, self.col) + color + char
+            + self.term.bright_white_on_black
+        )
 
-        :param d_row: How much to change the row by.
-        :param d_col: How much to change the column by.
-        """
-        self.row += d_row
-        self.col += d_col
-        self.row = self.row % self.data.height
-        self.col = self.col % self.data.width
-        self._draw_state()
-        self._draw_cursor()
+    def _render_ui(self) -> str:
+        """Render the UI for the edit state."""
+        return super()._render_ui() + self._render_cursor()
 
     # Public methods.
     def clear(self) -> 'Edit':
@@ -1193,7 +1301,6 @@ class Edit(State):
         """
         self.data.flip(self.col, self.row)
         self.data.generation = 0
-        self._draw_state()
         self._draw_cursor()
         return self
 
@@ -1296,15 +1403,6 @@ class Edit(State):
         self._move_cursor(distance * -1, 0)
         return self
 
-    def update_ui(self) -> None:
-        """Draw the UI for the edit state.
-
-        :returns: `None`.
-        :rtype: NoneType
-        """
-        super().update_ui()
-        self._draw_cursor()
-
 
 class End(State):
     """A state that terminates the game of life.
@@ -1406,11 +1504,12 @@ class Load(State):
         self.selected = 0
 
     # Private methods.
-    def _draw_state(self):
-        """Display the files available to be loaded."""
+    def _render_state(self) -> str:
+        """Render the files available to be loaded."""
         height = self.term.height - 3
 
         self._get_files()
+        lines = []
         start = 0
         stop = height
         if self.selected > height - 1:
@@ -1422,11 +1521,14 @@ class Load(State):
                 name = '\u25b8 ' + name
             if index + start == self.selected:
                 name = self.term.on_green + name + self.term.normal
-            print(self.term.move(index, 0) + name + self.term.clear_eol)
+            lines.append(
+                _move(self.term, index, 0) + name + self.term.clear_eol
+            )
 
         if len(self.files) < height:
             for y in range(len(self.files), height):
-                print(self.term.move(y, 0) + self.term.clear_eol)
+                lines.append(_move(self.term, y, 0) + self.term.clear_eol)
+        return ''.join(lines)
 
     def _get_files(self):
         """List the files available to be loaded."""
@@ -1942,7 +2044,7 @@ def main_loop(
     :rtype: NoneType
     """
     # Set up the initial state.
-    term = Terminal()
+    term = _get_terminal()
     if dimensions:
         grid = Grid(*dimensions, rule, wrap=not no_wrap)
     else:
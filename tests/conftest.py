@@ -0,0 +1,42 @@
+"""
+conftest
+~~~~~~~~
+
+Common fixtures for the unit tests of :mod:`life`.
+"""
+import numpy as np
+import pytest as pt
+
+from life import life, sui
+
+
+# Common fixtures.
+@pt.fixture
+def data_start():
+    return np.array([
+        [0, 1, 0, 1],
+        [0, 0, 0, 0],
+        [0, 1, 0, 0],
+        [0, 1, 0, 0],
+    ], dtype=bool)
+
+
+@pt.fixture
+def grid(data_start):
+    """A :class:`Grid` object for testing."""
+    return life.Grid.from_array(data_start)
+
+
+@pt.fixture
+def term(mocker):
+    """A 4x5 :class:`blessed.Terminal` object for testing. Its size and
+    input are patched onto the class, so every test shares the one
+    terminal the UI uses.
+    """
+    mocker.patch.multiple(
+        'blessed.Terminal',
+        height=5,
+        inkey=mocker.Mock(),
+        width=4
+    )
+    return sui._get_terminal()
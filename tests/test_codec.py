@@ -43,7 +43,7 @@ class TestCells:
             '..O..\n'
             '.....'
         )
-        assert (actual == data).all()
+        assert np.array_equal(actual, data)
         assert actual_info == util.FileInfo('spam', comment='bacon')
 
     def test_encode(self, data, info):
@@ -84,7 +84,7 @@ class TestPattern:
             '..X..\n'
             '.....'
         )
-        assert (actual == data).all()
+        assert np.array_equal(actual, data)
         assert actual_info == util.FileInfo()
 
     def test_encode(self, data):
@@ -110,7 +110,7 @@ class TestRLE:
             'x = 5, y = 5, rule = B3/S23\n'
             '5b$b3o$3bo$2bo!'
         )
-        assert (actual == data).all()
+        assert np.array_equal(actual, data)
         assert actual_info == info
 
     def test_encode(self, mocker, data, info):
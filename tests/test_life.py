@@ -22,25 +22,26 @@ def raises_test(cls, *args, **kwargs):
     return None
 
 
+def pat_to_array(pat):
+    return np.array([list(row) for row in pat]) == 'X'
+
+
 def pat_to_grid(pat):
-    width = len(pat[0])
-    height = len(pat)
-    grid = life.Grid(width, height)
-    grid._data = np.array(
-        [[True if c == 'X' else False for c in row] for row in pat],
-        dtype=bool
-    )
-    return grid
+    return life.Grid.from_array(pat_to_array(pat))
+
+
+# Common arrays.
+data_grid = np.array([
+    [0, 1, 0, 1],
+    [0, 0, 0, 0],
+    [0, 1, 0, 0],
+], dtype=bool)
 
 
 # Fixtures for Grid.
 @pt.fixture
 def grid():
-    grid = life.Grid(4, 3)
-    grid._data[0, 1] = True
-    grid._data[0, 3] = True
-    grid._data[2, 1] = True
-    return grid
+    return life.Grid.from_array(data_grid.copy())
 
 
 # Tests for Grid class methods.
@@ -52,10 +53,10 @@ def test_from_array():
         [0, 1],
         [1, 0],
     ], dtype=bool), 'B3/S23')
-    assert (grid._data == np.array([
+    assert np.array_equal(grid._data, np.array([
         [0, 1],
         [1, 0],
-    ], dtype=bool)).all()
+    ], dtype=bool))
     assert grid.rule == 'B3/S23'
 
 
@@ -112,11 +113,11 @@ def test_init_creates_empty_grid():
     Life grid.
     """
     grid = life.Grid(4, 3)
-    assert (grid._data == np.array([
+    assert np.array_equal(grid._data, np.array([
         [0, 0, 0, 0],
         [0, 0, 0, 0],
         [0, 0, 0, 0],
-    ], dtype=bool)).all()
+    ], dtype=bool))
 
 
 # Tests for Grid representations.
@@ -172,12 +173,12 @@ def test_sequence_protocol(grid):
         [0, 0, 0, 0],
     ], dtype=bool)
     giter = iter(grid)
-    assert (next(giter) == np.array([
+    assert np.array_equal(next(giter), np.array([
         [0, 1, 1, 0],
         [0, 0, 0, 0],
         [0, 0, 1, 1],
         [0, 1, 0, 1],
-    ], dtype=bool)).all()
+    ], dtype=bool))
 
 
 def test_mutablesequence_protocol(grid):
@@ -189,11 +190,11 @@ def test_mutablesequence_protocol(grid):
     # We are only implementing __setitem__.
     grid[0][0] = True
     grid[0, 2] = True
-    assert (grid._data == np.array([
+    assert np.array_equal(grid._data, np.array([
         [1, 1, 1, 1],
         [0, 0, 0, 0],
         [0, 1, 0, 0],
-    ], dtype=bool)).all()
+    ], dtype=bool))
 
     # It doesn't make sense to fully implement MutableSequence.
     assert raises(grid.__delitem__, 0) == tuple([
@@ -241,11 +242,11 @@ def test_clear(grid):
     from the grid.
     """
     grid.clear()
-    assert (grid._data == np.array([
+    assert np.array_equal(grid._data, np.array([
         [0, 0, 0, 0],
         [0, 0, 0, 0],
         [0, 0, 0, 0],
-    ], dtype=bool)).all()
+    ], dtype=bool))
 
 
 def test_flip(grid):
@@ -266,11 +267,11 @@ def test_randomize(grid):
     """
     grid.rng = np.random.default_rng(seed=1138)
     grid.randomize()
-    assert (grid._data == np.array([
+    assert np.array_equal(grid._data, np.array([
         [0, 0, 1, 1],
         [0, 0, 1, 1],
         [0, 1, 1, 0],
-    ], dtype=bool)).all()
+    ], dtype=bool))
 
 
 def test_replace_larger(grid):
@@ -286,11 +287,11 @@ def test_replace_larger(grid):
         [0, 1, 0, 1, 0],
         [0, 1, 0, 1, 0],
     ])
-    assert (grid._data == np.array([
+    assert np.array_equal(grid._data, np.array([
         [0, 1, 0, 1],
         [0, 1, 0, 1],
         [0, 1, 0, 1],
-    ], dtype=bool)).all()
+    ], dtype=bool))
 
 
 def test_replace_smaller(grid):
@@ -303,11 +304,11 @@ def test_replace_smaller(grid):
         [0, 1],
         [1, 0],
     ])
-    assert (grid._data == np.array([
+    assert np.array_equal(grid._data, np.array([
         [0, 0, 1, 0],
         [0, 1, 0, 0],
         [0, 0, 0, 0],
-    ], dtype=bool)).all()
+    ], dtype=bool))
 
 
 def test_tick(grid):
@@ -315,11 +316,11 @@ def test_tick(grid):
     one generation.
     """
     grid.tick()
-    assert (grid._data == np.array([
+    assert np.array_equal(grid._data, np.array([
         [1, 0, 1, 0],
         [1, 0, 1, 0],
         [1, 0, 1, 0],
-    ], dtype=bool)).all()
+    ], dtype=bool))
     assert grid.generation == 1
 
     grid._data = np.array([
@@ -329,12 +330,12 @@ def test_tick(grid):
         [0, 0, 0, 0],
     ], dtype=bool)
     grid.tick()
-    assert (grid._data == np.array([
+    assert np.array_equal(grid._data, np.array([
         [0, 1, 1, 0],
         [0, 0, 0, 0],
         [0, 0, 1, 1],
         [0, 1, 0, 1],
-    ], dtype=bool)).all()
+    ], dtype=bool))
     assert grid.generation == 2
 
     grid = pat_to_grid([
@@ -357,7 +358,7 @@ def test_tick(grid):
     ])
     grid.rule = 'B36/S23'
     grid.tick()
-    assert (grid._data == pat_to_grid([
+    assert np.array_equal(grid._data, pat_to_array([
         '................',
         '.......X..XX....',
         '.......X....X...',
@@ -374,7 +375,7 @@ def test_tick(grid):
         '................',
         '................',
         '................',
-    ])._data).all()
+    ]))
     assert grid.generation == 1
 
 
@@ -386,11 +387,11 @@ def test_tick_no_wrap(grid):
     """
     grid.wrap = False
     grid.tick()
-    assert (grid._data == np.array([
+    assert np.array_equal(grid._data, np.array([
         [0, 0, 0, 0],
         [0, 0, 1, 0],
         [0, 0, 0, 0],
-    ], dtype=bool)).all()
+    ], dtype=bool))
 
 #     grid._data = np.array([
 #         [0, 1, 1, 0],
@@ -450,18 +451,18 @@ def test_view(grid):
     """When called, :meth:`Grid.view` should return the data in
     the grid.
     """
-    assert (grid.view() == np.array([
+    assert np.array_equal(grid.view(), np.array([
         [0, 1, 0, 1],
         [0, 0, 0, 0],
         [0, 1, 0, 0],
-    ], dtype=bool)).all()
+    ], dtype=bool))
 
 
 def test_view_with_window(grid):
     """When called with anchor coordinates and a shape, :meth:`Grid.view`
     should return a subsection of the data in the :class:`Grid`.
     """
-    assert (grid.view((1, 1), (2, 2)) == np.array([
+    assert np.array_equal(grid.view((1, 1), (2, 2)), np.array([
         [0, 0,],
         [1, 0,],
-    ], dtype=bool)).all()
+    ], dtype=bool))
@@ -25,116 +25,141 @@ SLEFT = '\x1b[1;2D'
 SRIGHT = '\x1b[1;2C'
 
 # Common arrays.
+data_flipped = np.array([
+    [0, 1, 0, 1],
+    [0, 0, 0, 0],
+    [0, 1, 1, 0],
+    [0, 1, 0, 0],
+], dtype=bool)
+data_loaded = np.array([
+    [0, 1, 0, 1],
+    [1, 0, 1, 0],
+    [0, 1, 0, 1],
+    [0, 0, 0, 0],
+], dtype=bool)
+data_loaded_window = np.array([
+    [0, 0, 0, 0, 0, 0],
+    [0, 0, 1, 0, 1, 0],
+    [0, 1, 0, 1, 0, 0],
+    [0, 0, 1, 0, 1, 0],
+    [0, 0, 0, 0, 0, 0],
+    [0, 0, 0, 0, 0, 0],
+], dtype=bool)
 data_next = np.array([
     [1, 0, 1, 0],
     [1, 0, 1, 0],
     [0, 0, 0, 0],
     [0, 1, 0, 0],
 ], dtype=bool)
+data_random = np.array([
+    [0, 0, 1, 1],
+    [0, 0, 1, 1],
+    [0, 1, 1, 0],
+    [1, 0, 1, 0],
+], dtype=bool)
+
+# Terminal for building the expected output. It is the same terminal
+# the term fixture gives the tests to draw to.
+term_ = sui._get_terminal()
+
+# Terminal styles for the edit cursor:
+BGREEN = term_.bright_green
+BGREEN_ON_BWHITE = term_.bright_green_on_bright_white
+BWHITE_ON_BLACK = term_.bright_white_on_black
+GREEN = term_.green
+
+# Terminal sequences for menus, prompts, and selections:
+BLACK_ON_GREEN = term_.black_on_green
+CLEAR_EOL = term_.clear_eol
+NORMAL = term_.normal
+ON_GREEN = term_.on_green
 
 # Common lines.
-term_ = blessed.Terminal()
+hr = '\u2500' * 4
 grid_start_lines = (
-    term_.move(0, 0) + ' \u2580 \u2580\n'
-    + term_.move(1, 0) + ' \u2588  \n'
+    term_.move(0, 0) + ' \u2580 \u2580'
+    + term_.move(1, 0) + ' \u2588  '
 )
 grid_next_lines = (
-    term_.move(0, 0) + '\u2588 \u2588 \n'
-    + term_.move(1, 0) + ' \u2584  \n'
+    term_.move(0, 0) + '\u2588 \u2588 '
+    + term_.move(1, 0) + ' \u2584  '
+)
+prompt_blank = term_.move(4, 0) + CLEAR_EOL
+prompt_invalid = (
+    term_.move(4, 0) + 'Invalid command. Please try again.'
+    + CLEAR_EOL
 )
 
 
-# Common fixtures.
-@pt.fixture
-def data_start():
-    return np.array([
-        [0, 1, 0, 1],
-        [0, 0, 0, 0],
-        [0, 1, 0, 0],
-        [0, 1, 0, 0],
-    ], dtype=bool)
+# Common functions.
+def at(y, x):
+    """The sequence that moves the cursor to the given location."""
+    return term_.move(y, x)
+
+
+def menu_lines(menu):
+    """The expected output for the rule and the commands below the
+    grid, given the menu of the state.
+    """
+    return (
+        at(2, 0) + hr
+        + at(3, 0) + menu + CLEAR_EOL
+    )
+
 
+def resize_term(mocker, term, height, width):
+    """Change the size of the test terminal. The size is patched as
+    plain values, since only input needs a mock.
+    """
+    mocker.patch.multiple('blessed.Terminal', height=height, width=width)
+    return term
 
+
+# Common fixtures.
 @pt.fixture
 def big_grid():
     """A 6x6 :class:`life.Grid` object for testing."""
-    grid = life.Grid(6, 6)
-    grid._data = np.array([
+    return life.Grid.from_array(np.array([
         [0, 1, 0, 1, 0, 1],
         [1, 0, 1, 0, 1, 0],
         [0, 1, 0, 1, 0, 1],
         [1, 0, 1, 0, 1, 0],
         [0, 1, 0, 1, 0, 1],
         [1, 0, 1, 0, 1, 0],
-    ], dtype=bool)
-    return grid
+    ], dtype=bool))
 
 
 @pt.fixture
-def grid(data_start):
+def grid_40():
     """A :class:`Grid` object for testing."""
-    grid = life.Grid(4, 4)
-    grid._data = data_start
-    return grid
+    return life.Grid(40, 40)
 
 
 @pt.fixture
-def grid_40(data_start):
-    """A :class:`Grid` object for testing."""
-    grid = life.Grid(40, 40)
-    return grid
+def term_40(mocker, term):
+    """A 40x40 :class:`blessed.Terminal` object for testing."""
+    return resize_term(mocker, term, 40, 40)
 
 
 @pt.fixture
-def term(mocker):
-    """A :class:`blessed.Terminal` object for testing."""
-    mocker.patch('blessed.Terminal.inkey')
-    mocker.patch(
-        'blessed.Terminal.height',
-        return_value=5,
-        new_callable=mocker.PropertyMock
-    )
-    mocker.patch(
-        'blessed.Terminal.width',
-        return_value=4,
-        new_callable=mocker.PropertyMock
-    )
-    return blessed.Terminal()
+def small_term(mocker, term):
+    """A 2x4 :class:`blessed.Terminal` object for testing."""
+    return resize_term(mocker, term, 4, 2)
 
 
 @pt.fixture
-def term_40(mocker):
-    """A :class:`blessed.Terminal` object for testing."""
-    mocker.patch('blessed.Terminal.inkey')
-    mocker.patch(
-        'blessed.Terminal.height',
-        return_value=40,
-        new_callable=mocker.PropertyMock
-    )
-    mocker.patch(
-        'blessed.Terminal.width',
-        return_value=40,
-        new_callable=mocker.PropertyMock
-    )
-    return blessed.Terminal()
+def writes(monkeypatch):
+    """The text each call to :meth:`State._write` sends to the
+    terminal, one item per write. Only for tests that need to tell the
+    writes apart. Tests of the output itself use capsys.
+    """
+    writes = []
 
+    def _write(self, text):
+        writes.append(text)
 
-@pt.fixture
-def small_term(mocker):
-    """A 2x4 :class:`bless.Terminal` object for testing."""
-    mocker.patch('blessed.Terminal.inkey')
-    mocker.patch(
-        'blessed.Terminal.height',
-        return_value=4,
-        new_callable=mocker.PropertyMock
-    )
-    mocker.patch(
-        'blessed.Terminal.width',
-        return_value=2,
-        new_callable=mocker.PropertyMock
-    )
-    term = blessed.Terminal()
-    return term
+    monkeypatch.setattr(sui.State, '_write', _write)
+    return writes
 
 
 # Tests for Autorun.
@@ -174,14 +199,18 @@ class TestAutorun():
             assert getattr(obj, attr) is optional[attr]
 
     # Tests for Autorun input.
-    def test_Autorun_input(self, autorun):
+    @pt.mark.parametrize('key,cmd', [
+        (LEFT, ('slower',)),
+        (RIGHT, ('faster',)),
+        ('x', ('exit',)),
+        (' ', ('exit',)),
+    ])
+    def test_Autorun_input(self, autorun, key, cmd):
         """If a key is pressed, :meth:`Autorun.input` should return an
         command string.
         """
-        autorun.term.inkey.side_effect = [LEFT, RIGHT, 'x',]
-        assert autorun.input() == ('slower',)
-        assert autorun.input() == ('faster',)
-        assert autorun.input() == ('exit',)
+        autorun.term.inkey.return_value = key
+        assert autorun.input() == cmd
 
     def test_Autorun_input_timeout(self, autorun):
         """If no key is pressed, :meth:`Autorun.input` should return a
@@ -201,7 +230,7 @@ class TestAutorun():
         assert state.data is autorun.data
         assert state.term is autorun.term
 
-    def test_Autorun_exit(self, window_autorun):
+    def test_Autorun_exit_window(self, window_autorun):
         """When called :func:`Autorun.exit` should return a :class:`Core`
         object populated with its :class:`Grid` and :class:`blessed.Terminal`
         objects.
@@ -228,20 +257,18 @@ class TestAutorun():
         """
         state = autorun.run()
         assert state is autorun
-        assert (autorun.data._data == data_next).all()
+        assert np.array_equal(autorun.data._data, data_next)
 
     def test_Autorun_run_pace(self, mocker, autorun):
         """When called, :meth:`Autorun.run` should advance the grid and
         return the :class:`Autorun` object.
         """
-        mock_sleep = mocker.patch('life.sui.sleep')
+        mock_sleep = mocker.patch('life.sui.sleep', new_callable=mocker.Mock)
         autorun.pace = 0.01
         state = autorun.run()
         assert state is autorun
-        assert (autorun.data._data == data_next).all()
-        assert mock_sleep.mock_calls == [
-            mocker.call(0.01),
-        ]
+        assert np.array_equal(autorun.data._data, data_next)
+        mock_sleep.assert_called_once_with(0.01)
 
     def test_Autorun_slower(self, autorun):
         """When called :func:`Autorun.slower` should increment the pace
@@ -253,16 +280,17 @@ class TestAutorun():
         assert state.pace == 0.03 + 0.01
 
     # Tests for Autorun UI updates.
+    @pt.mark.ui
     def test_Autorun_update_ui(self, capsys, autorun, term):
         """When called, :meth:`Autorun.update_ui` should redraw the UI."""
         autorun.update_ui()
         captured = capsys.readouterr()
-        assert repr(captured.out) == repr(
+        assert captured.out == (
             grid_start_lines
-            + term.move(2, 0) + '\u2500' * 4 + '\n'
-            + term.move(3, 0) + autorun.menu + term.clear_eol
+            + menu_lines(autorun.menu)
         )
 
+    @pt.mark.ui
     def test_Autorun_update_ui_show_generation(self, capsys, autorun, term):
         """When called, :meth:`Autorun.update_ui` should redraw the UI.
         If set to show the generation, the generation should be shown.
@@ -270,11 +298,10 @@ class TestAutorun():
         autorun.show_generation = True
         autorun.update_ui()
         captured = capsys.readouterr()
-        assert repr(captured.out) == repr(
+        assert captured.out == (
             grid_start_lines
-            + term.move(2, 0) + '\u2500' * 4 + '\n'
-            + term.move(3, 0) + autorun.menu + term.clear_eol
-            + term.move(2, 0) + 'Generation: 0'
+            + menu_lines(autorun.menu)
+            + at(2, 0) + 'Generation: 0'
         )
 
 
@@ -472,34 +499,52 @@ class TestConfig:
         assert config.selected == len(config.settings) - 1
 
     # Tests for Config input.
-    def test_Config_input(self, config):
+    @pt.mark.parametrize('key,cmd', [
+        (DOWN, ('down',)),
+        (UP, ('up',)),
+        ('x', ('exit',)),
+        ('\n', ('select',)),
+    ])
+    def test_Config_input(self, config, key, cmd):
         """When valid given input, :meth:`Config.input` should return the
         expected command string.
         """
-        config.term.inkey.side_effect = [DOWN, UP, 'x', '\n',]
-        assert config.input() == ('down',)
-        assert config.input() == ('up',)
-        assert config.input() == ('exit',)
-        assert config.input() == ('select',)
+        config.term.inkey.return_value = key
+        assert config.input() == cmd
 
     # Tests for Config UI updates.
+    @pt.mark.ui
     def test_Config_update_ui(self, capsys, config, term):
         """When called, :meth:`Config.update_ui` should redraw the UI
         for the config state.
         """
         config.update_ui()
         captured = capsys.readouterr()
-        assert repr(captured.out) == repr(
-            term.move(0, 0) + term.black_on_green
-            + 'Comment: ' + term.clear_eol + term.normal
-            + term.move(1, 0) + 'Pace: 0' + term.clear_eol
-            + term.move(2, 0) + 'Rule: B3/S23' + term.clear_eol
-            + term.move(3, 0) + 'Save Format: cells' + term.clear_eol
-            + term.move(4, 0) + 'Show Generation: False' + term.clear_eol
-            + term.move(5, 0) + 'User: ' + term.clear_eol
-            + term.move(6, 0) + 'Wrap: True' + term.clear_eol
-            + term.move(2, 0) + '\u2500' * 4 + '\n'
-            + term.move(3, 0) + config.menu + term.clear_eol
+        assert captured.out == (
+            at(0, 0) + BLACK_ON_GREEN
+            + 'Comment: ' + CLEAR_EOL + NORMAL
+            + at(1, 0) + 'Pace: 0' + CLEAR_EOL
+            + at(2, 0) + 'Rule: B3/S23' + CLEAR_EOL
+            + at(3, 0) + 'Save Format: cells' + CLEAR_EOL
+            + at(4, 0) + 'Show Generation: False' + CLEAR_EOL
+            + at(5, 0) + 'User: ' + CLEAR_EOL
+            + at(6, 0) + 'Wrap: True' + CLEAR_EOL
+            + menu_lines(config.menu)
+        )
+
+    @pt.mark.ui
+    def test_Config_update_ui_short_term(self, mocker, config, term, writes):
+        """When called on a terminal that isn't taller than the list of
+        settings, :meth:`Config.update_ui` should redraw the rule and
+        the commands every time, since the settings draw over them.
+        """
+        resize_term(mocker, term, 7, 4)
+        config.update_ui()
+        config.down()
+        config.update_ui()
+        assert writes[1].endswith(
+            at(4, 0) + '\u2500' * 4
+            + at(5, 0) + config.menu + CLEAR_EOL
         )
 
 
@@ -627,7 +672,7 @@ class TestCore:
         """
         state = core.next()
         assert state is core
-        assert (core.data._data == data_next).all()
+        assert np.array_equal(core.data._data, data_next)
 
     def test_Core_random(self, core):
         """When called, :meth:`Core.random` should fill the grid
@@ -636,12 +681,7 @@ class TestCore:
         core.data.rng = np.random.default_rng(seed=1138)
         state = core.random()
         assert state is core
-        assert (core.data._data == np.array([
-            [0, 0, 1, 1],
-            [0, 0, 1, 1],
-            [0, 1, 1, 0],
-            [1, 0, 1, 0],
-        ], dtype=bool)).all()
+        assert np.array_equal(core.data._data, data_random)
 
     def test_Core_quit(self, core):
         """When called, :meth:`Core.quit` should return an
@@ -659,7 +699,7 @@ class TestCore:
         assert state.data is core.data
         assert state.term is core.term
 
-    def test_Core_save(self, window_core):
+    def test_Core_save_window(self, window_core):
         """When called, :meth:`Core.save` should return a
         :class:`Save` object.
         """
@@ -671,21 +711,32 @@ class TestCore:
         assert state.origin_y == window_core.origin_y
 
     # Tests for Core input.
-    def test_Core_input(self, core):
+    def test_Core_commands(self):
+        """The commands of :class:`Core` should be stored as
+        :class:`Command` tuples, so they can be returned by
+        :meth:`Core.input` without conversion.
+        """
+        assert sui.Core.commands['e'] == ('edit',)
+
+    @pt.mark.parametrize('key,cmd', [
+        ('a', ('autorun',)),
+        ('e', ('edit',)),
+        ('f', ('config',)),
+        ('l', ('load',)),
+        ('m', ('move',)),
+        ('n', ('next',)),
+        ('r', ('random',)),
+        ('s', ('save',)),
+        ('q', ('quit',)),
+    ])
+    def test_Core_input(self, core, key, cmd):
         """When valid given input, :meth:`Core.input` should return the
         expected command string.
         """
-        core.term.inkey.side_effect = 'aeflmnrsq'
-        assert core.input() == ('autorun',)
-        assert core.input() == ('edit',)
-        assert core.input() == ('config',)
-        assert core.input() == ('load',)
-        assert core.input() == ('move',)
-        assert core.input() == ('next',)
-        assert core.input() == ('random',)
-        assert core.input() == ('save',)
-        assert core.input() == ('quit',)
+        core.term.inkey.return_value = key
+        assert core.input() == cmd
 
+    @pt.mark.ui
     def test_Core_input_invalid(self, capsys, core, term):
         """Given invalid input, :meth:`Core.input` should prompt the
         user to try again.
@@ -693,26 +744,50 @@ class TestCore:
         core.term.inkey.side_effect = ('`', 'e')
         assert core.input() == ('edit',)
         captured = capsys.readouterr()
-        assert repr(captured.out) == repr(
-            term.move(4, 0) + term.clear_eol
-            + term.move(4, 0) + term.clear_eol
-            + term.move(4, 0) + 'Invalid command. Please try again.'
-            + term.clear_eol
+        assert captured.out == prompt_blank + prompt_invalid
+
+    @pt.mark.ui
+    def test_Core_input_invalid_repeated(self, capsys, mocker, core, term):
+        """Given repeated invalid input, :meth:`Core.input` should
+        blank the prompt before prompting the user to try again.
+        """
+        mocker.patch('life.sui.sleep', new_callable=mocker.Mock)
+        core.term.inkey.side_effect = ('`', '`', 'e')
+        assert core.input() == ('edit',)
+        captured = capsys.readouterr()
+        assert captured.out == (
+            prompt_blank + prompt_invalid + prompt_blank + prompt_invalid
         )
 
     # Tests for Core UI updates.
+    @pt.mark.ui
     def test_Core_update_ui(self, capsys, core, term):
         """When called, :meth:`Core.update_ui` should redraw the UI
         for the core state.
         """
         core.update_ui()
         captured = capsys.readouterr()
-        assert repr(captured.out) == repr(
+        assert captured.out == (
             grid_start_lines
-            + term.move(2, 0) + '\u2500' * 4 + '\n'
-            + term.move(3, 0) + core.menu + term.clear_eol
+            + menu_lines(core.menu)
         )
 
+    @pt.mark.ui
+    def test_Core_update_ui_resized(self, mocker, core, term, writes):
+        """When called after the terminal is resized,
+        :meth:`Core.update_ui` should redraw the whole UI, even the
+        parts that haven't changed. The rule should fit the new width.
+        """
+        core.update_ui()
+        resize_term(mocker, term, 5, 8)
+        core.update_ui()
+        assert writes[1].startswith(grid_start_lines)
+        assert writes[1].endswith(
+            at(2, 0) + '\u2500' * 8
+            + at(3, 0) + core.menu + CLEAR_EOL
+        )
+
+    @pt.mark.ui
     def test_Core_update_ui_show_generation(self, capsys, core, term):
         """When called, :meth:`Core.update_ui` should redraw the UI
         for the core state. If set to show the generation, then the
@@ -721,13 +796,61 @@ class TestCore:
         core.show_generation = True
         core.update_ui()
         captured = capsys.readouterr()
-        assert repr(captured.out) == repr(
+        assert captured.out == (
             grid_start_lines
-            + term.move(2, 0) + '\u2500' * 4 + '\n'
-            + term.move(3, 0) + core.menu + term.clear_eol
-            + term.move(2, 0) + 'Generation: 0'
+            + menu_lines(core.menu)
+            + at(2, 0) + 'Generation: 0'
         )
 
+    @pt.mark.ui
+    def test_Core_update_ui_redraw(self, capsys, core, term):
+        """When called again, :meth:`Core.update_ui` should only redraw
+        the parts of the UI that changed.
+        """
+        core.update_ui()
+        capsys.readouterr()
+        core.data.flip(3, 3)
+        core.update_ui()
+        captured = capsys.readouterr()
+        assert captured.out == (
+            at(1, 0) + ' \u2588 \u2584'
+        )
+
+    @pt.mark.ui
+    def test_Core_update_ui_redraw_generation(self, capsys, core, term):
+        """When called again, :meth:`Core.update_ui` should only redraw
+        the parts of the UI that changed. If the generation is shown,
+        the generation should be redrawn when it changes.
+        """
+        core.show_generation = True
+        core.update_ui()
+        capsys.readouterr()
+        core.data.generation = 1
+        core.update_ui()
+        captured = capsys.readouterr()
+        assert captured.out == (
+            at(2, 0) + 'Generation: 1'
+        )
+
+    @pt.mark.ui
+    def test_Core_update_ui_single_write(self, core, writes):
+        """When called, :meth:`Core.update_ui` should send the whole
+        UI to the terminal in a single write.
+        """
+        core.show_generation = True
+        core.update_ui()
+        assert len(writes) == 1
+
+    @pt.mark.ui
+    def test_Core_update_ui_unchanged(self, core, writes):
+        """When called and nothing has changed since the last time it
+        was called, :meth:`Core.update_ui` should not write anything
+        to the terminal.
+        """
+        core.update_ui()
+        core.update_ui()
+        assert len(writes) == 1
+
 
 # Tests for Edit.
 class TestEdit:
@@ -737,14 +860,14 @@ class TestEdit:
         """An :class:`Edit` object for testing."""
         edit = sui.Edit(grid, term)
         edit.path = tmp_path / '.snapshot.cells'
-        yield edit
+        return edit
 
     @pt.fixture
     def edit_40(self, grid_40, term_40, tmp_path):
         """An :class:`Edit` object for testing."""
         edit = sui.Edit(grid_40, term_40)
         edit.path = tmp_path / '.snapshot.txt'
-        yield edit
+        return edit
 
     @pt.fixture
     def window_edit(self, big_grid, small_term, tmp_path):
@@ -753,7 +876,7 @@ class TestEdit:
         edit.path = tmp_path / '.snapshot.txt'
         edit.origin_x = 1
         edit.origin_y = 3
-        yield edit
+        return edit
 
     # Tests for Edit initialization.
     def test_Edit_init(self, grid, term):
@@ -777,28 +900,42 @@ class TestEdit:
         state = edit.clear()
         assert state is edit
 
-    def test_Edit_down(self, capsys, edit, term):
-        """When called, :meth:`Edit.down` should add one from the row,
-        redraw the status, redraw the cursor, and return its parent object.
-        """
-        state = edit.down()
+    @pt.mark.ui
+    @pt.mark.parametrize('cmd,y,x,style,char', [
+        ('down', 1, 2, GREEN, '\u2584'),
+        ('left', 1, 1, BGREEN_ON_BWHITE, '\u2580'),
+        ('right', 1, 3, GREEN, '\u2580'),
+        ('up', 0, 2, GREEN, '\u2584'),
+    ])
+    def test_Edit_cursor(self, capsys, edit, term, cmd, y, x, style, char):
+        """When called, the cursor movement methods of :class:`Edit`
+        should move the cursor by one, redraw the grid and the cursor,
+        and return their parent object.
+        """
+        state = getattr(edit, cmd)()
         captured = capsys.readouterr()
         assert state is edit
-        assert repr(captured.out) == repr(
+        assert captured.out == (
             grid_start_lines
-            + term.move(1, 2) + term.green + '\u2584'
-            + term.bright_white_on_black + '\n'
+            + at(y, x) + style + char
+            + BWHITE_ON_BLACK
         )
 
-    def test_Edit_down_10(self, edit_40):
-        """When called with ten, :meth:`Edit.down` should add ten to the
-        row, redraw the status, redraw the cursor, and return its parent
-        object.
-        """
-        state = edit_40.down(10)
+    @pt.mark.parametrize('cmd,row,col', [
+        ('down', 30, 20),
+        ('left', 20, 10),
+        ('right', 20, 30),
+        ('up', 10, 20),
+    ])
+    def test_Edit_cursor_10(self, edit_40, cmd, row, col):
+        """When called with ten, the cursor movement methods of
+        :class:`Edit` should move the cursor by ten and return their
+        parent object.
+        """
+        state = getattr(edit_40, cmd)(10)
         assert state is edit_40
-        assert state.row == 30
-        assert state.col == 20
+        assert state.row == row
+        assert state.col == col
 
     def test_Edit_exit(self, edit):
         """When called, :meth:`Edit.exit` should return a :class:`Core`
@@ -820,6 +957,7 @@ class TestEdit:
         assert state.origin_x == window_edit.origin_x
         assert state.origin_y == window_edit.origin_y
 
+    @pt.mark.ui
     def test_Edit_flip(self, capsys, edit, term):
         """When called, :meth:`Edit.flip` should flip the selected
         location and return its parent object.
@@ -828,68 +966,22 @@ class TestEdit:
         state = edit.flip()
         captured = capsys.readouterr()
         assert state is edit
-        assert (state.data._data == np.array([
-            [0, 1, 0, 1],
-            [0, 0, 0, 0],
-            [0, 1, 1, 0],
-            [0, 1, 0, 0],
-        ], dtype=bool)).all()
-        assert repr(captured.out) == repr(
-            term_.move(0, 0) + ' \u2580 \u2580\n'
-            + term_.move(1, 0) + ' \u2588\u2580 \n'
-            + term.move(1, 2) + term.bright_green + '\u2580'
-            + term.bright_white_on_black + '\n'
+        assert np.array_equal(state.data._data, data_flipped)
+        assert captured.out == (
+            at(0, 0) + ' \u2580 \u2580'
+            + at(1, 0) + ' \u2588\u2580 '
+            + at(1, 2) + BGREEN + '\u2580'
+            + BWHITE_ON_BLACK
         )
         assert state.data.generation == 0
 
-    def test_Edit_left(self, capsys, edit, term):
-        """When called, :meth:`Edit.left` should subtract one from the col,
-        redraw the status, redraw the cursor, and return its parent object.
+    @pt.mark.ui
+    def test_Edit_flip_single_write(self, edit, writes):
+        """When called, :meth:`Edit.flip` should send the grid and the
+        cursor to the terminal in a single write.
         """
-        state = edit.left()
-        captured = capsys.readouterr()
-        assert state is edit
-        assert repr(captured.out) == repr(
-            term_.move(0, 0) + ' \u2580 \u2580\n'
-            + term_.move(1, 0) + ' \u2588  \n'
-            + term.move(1, 1) + term.bright_green_on_bright_white + '\u2580'
-            + term.bright_white_on_black + '\n'
-        )
-
-    def test_Edit_left_10(self, edit_40):
-        """When called with ten, :meth:`Edit.left` should subtract ten
-        from the col, redraw the status, redraw the cursor, and return
-        its parent object.
-        """
-        state = edit_40.left(10)
-        assert state is edit_40
-        assert state.row == 20
-        assert state.col == 10
-
-    def test_Edit_right(self, capsys, edit, term):
-        """When called, :meth:`Edit.right` should add one to the col,
-        redraw the status, redraw the cursor, and return its parent
-        object.
-        """
-        state = edit.right()
-        captured = capsys.readouterr()
-        assert state is edit
-        assert repr(captured.out) == repr(
-            term_.move(0, 0) + ' \u2580 \u2580\n'
-            + term_.move(1, 0) + ' \u2588  \n'
-            + term.move(1, 3) + term.green + '\u2580'
-            + term.bright_white_on_black + '\n'
-        )
-
-    def test_Edit_right_10(self, edit_40):
-        """When called with 10, :meth:`Edit.right` should add ten to the
-        col, redraw the status, redraw the cursor, and return its parent
-        object.
-        """
-        state = edit_40.right(10)
-        assert state is edit_40
-        assert state.row == 20
-        assert state.col == 30
+        edit.flip()
+        assert len(writes) == 1
 
     def test_Edit_restore(self, edit, term):
         """When called, :meth:`Edit.restore` should load the snapshot file
@@ -899,12 +991,7 @@ class TestEdit:
         edit.path = Path('tests/data/.snapshot.txt')
         state = edit.restore()
         assert state is edit
-        assert (edit.data._data == np.array([
-            [0, 1, 0, 1],
-            [1, 0, 1, 0],
-            [0, 1, 0, 1],
-            [0, 0, 0, 0],
-        ], dtype=bool)).all()
+        assert np.array_equal(edit.data._data, data_loaded)
         assert state.data.generation == 0
 
     def test_Edit_restore_no_snapshot(self, edit, term, data_start, tmp_path):
@@ -915,8 +1002,9 @@ class TestEdit:
         edit.path = tmp_path / '.snapshot.txt'
         state = edit.restore()
         assert state is edit
-        assert (edit.data._data == data_start).all()
+        assert np.array_equal(edit.data._data, data_start)
 
+    @pt.mark.ui
     def test_Edit_snapshot(self, capsys, edit, term):
         """When called, :meth:`Edit.snapshot` should write the grid to
         the snapshot file and return the parent object.
@@ -926,7 +1014,7 @@ class TestEdit:
             saved = fh.read()
         captured = capsys.readouterr()
         assert state is edit
-        assert repr(saved) == repr(
+        assert saved == (
             '!Name: .snapshot.cells\n'
             '! B3/S23\n'
             'O.O\n'
@@ -934,80 +1022,75 @@ class TestEdit:
             'O..\n'
             'O..\n'
         )
-        assert repr(captured.out) == repr(
-            term.move(4, 0) + 'Saving...' + term.clear_eol
-        )
-
-    def test_Edit_up(self, capsys, edit, term):
-        """When called, :meth:`Edit.up` should add one to the row, redraw
-        the status, redraw the cursor, and return its parent object.
-        """
-        state = edit.up()
-        captured = capsys.readouterr()
-        assert state is edit
-        assert repr(captured.out) == repr(
-            grid_start_lines
-            + term.move(0, 2) + term.green + '\u2584'
-            + term.bright_white_on_black + '\n'
+        assert captured.out == (
+            at(4, 0) + 'Saving...' + CLEAR_EOL
         )
 
-    def test_Edit_up_10(self, edit_40):
-        """When called with 10, :meth:`Edit.up` should subtract ten from
-        the row, redraw the status, redraw the cursor, and return its parent
-        object.
-        """
-        state = edit_40.up(10)
-        assert state is edit_40
-        assert state.row == 10
-        assert state.col == 20
-
     # Tests for Edit input.
-    def test_Edit_input(self, edit, term):
+    @pt.mark.parametrize('key,cmd', [
+        (DOWN, ('down', 1)),
+        (SDOWN, ('down', 10)),
+        (LEFT, ('left', 1)),
+        (SLEFT, ('left', 10)),
+        (RIGHT, ('right', 1)),
+        (SRIGHT, ('right', 10)),
+        (UP, ('up', 1)),
+        (SUP, ('up', 10)),
+        (' ', ('flip',)),
+        ('c', ('clear',)),
+        ('r', ('restore',)),
+        ('s', ('snapshot',)),
+        ('x', ('exit',)),
+    ])
+    def test_Edit_input(self, edit, key, cmd):
         """When given input, :meth:`Edit.input` should return the expected
         command string.
         """
-        edit.term.inkey.side_effect = [
-            DOWN,
-            SDOWN,
-            LEFT,
-            SLEFT,
-            RIGHT,
-            SRIGHT,
-            UP,
-            SUP,
-            ' ',
-            'c',
-            'r',
-            's',
-            'x',
-        ]
-        assert edit.input() == ('down', 1)
-        assert edit.input() == ('down', 10)
-        assert edit.input() == ('left', 1)
-        assert edit.input() == ('left', 10)
-        assert edit.input() == ('right', 1)
-        assert edit.input() == ('right', 10)
-        assert edit.input() == ('up', 1)
-        assert edit.input() == ('up', 10)
-        assert edit.input() == ('flip',)
-        assert edit.input() == ('clear',)
-        assert edit.input() == ('restore',)
-        assert edit.input() == ('snapshot',)
-        assert edit.input() == ('exit',)
+        edit.term.inkey.side_effect = [key, '']
+        assert edit.input() == cmd
+
+    def test_Edit_input_repeated(self, mocker, edit):
+        """When the same movement is waiting in the input more than
+        once, :meth:`Edit.input` should combine them into one command,
+        leaving any other key for the next call.
+        """
+        mock_ungetch = mocker.patch(
+            'blessed.Terminal.ungetch',
+            new_callable=mocker.Mock
+        )
+        edit.term.inkey.side_effect = [DOWN, DOWN, SDOWN, UP]
+        assert edit.input() == ('down', 12)
+        mock_ungetch.assert_called_once_with(UP)
 
     # Tests for Edit UI updates.
+    @pt.mark.ui
     def test_Edit_update_ui(self, capsys, edit, term):
         """When called, :meth:`Edit.update_ui` should draw the UI for
         edit mode.
         """
         edit.update_ui()
         captured = capsys.readouterr()
-        assert repr(captured.out) == repr(
+        assert captured.out == (
             grid_start_lines
-            + term.move(2, 0) + '\u2500' * 4 + '\n'
-            + term.move(3, 0) + edit.menu + term.clear_eol
-            + term.move(1, 2) + term.green + '\u2580'
-            + term.bright_white_on_black + '\n'
+            + menu_lines(edit.menu)
+            + at(1, 2) + GREEN + '\u2580'
+            + BWHITE_ON_BLACK
+        )
+
+    @pt.mark.ui
+    def test_Edit_update_ui_move_cursor(self, capsys, edit, term):
+        """When the cursor moves after :meth:`Edit.update_ui` is called,
+        only the row the cursor left should be redrawn before the cursor
+        is drawn in its new location.
+        """
+        edit.update_ui()
+        capsys.readouterr()
+        edit.down()
+        captured = capsys.readouterr()
+        assert captured.out == (
+            at(1, 0) + ' \u2588  '
+            + at(1, 2) + GREEN + '\u2584'
+            + BWHITE_ON_BLACK
         )
 
 
@@ -1117,12 +1200,7 @@ class TestLoad:
         assert isinstance(state, sui.Core)
         assert state.data is load.data
         assert state.term is load.term
-        assert (state.data._data == np.array([
-            [0, 1, 0, 1],
-            [1, 0, 1, 0],
-            [0, 1, 0, 1],
-            [0, 0, 0, 0],
-        ], dtype=bool)).all()
+        assert np.array_equal(state.data._data, data_loaded)
         assert state.data.generation == 0
 
     def test_Load_load_directory(self, load):
@@ -1150,12 +1228,7 @@ class TestLoad:
         assert isinstance(state, sui.Core)
         assert state.data is load.data
         assert state.term is load.term
-        assert (state.data._data == np.array([
-            [0, 1, 0, 1],
-            [1, 0, 1, 0],
-            [0, 1, 0, 1],
-            [0, 0, 0, 0],
-        ], dtype=bool)).all()
+        assert np.array_equal(state.data._data, data_loaded)
         assert state.data.generation == 0
         assert state.user == 'Baked Beans'
         assert state.comment == 'Tomato.'
@@ -1170,14 +1243,7 @@ class TestLoad:
         assert state.term is window_load.term
         assert state.origin_x == window_load.origin_x
         assert state.origin_y == window_load.origin_y
-        assert (state.data._data == np.array([
-            [0, 0, 0, 0, 0, 0],
-            [0, 0, 1, 0, 1, 0],
-            [0, 1, 0, 1, 0, 0],
-            [0, 0, 1, 0, 1, 0],
-            [0, 0, 0, 0, 0, 0],
-            [0, 0, 0, 0, 0, 0],
-        ], dtype=bool)).all()
+        assert np.array_equal(state.data._data, data_loaded_window)
 
     def test_Load_up(self, load):
         """When called, :meth:`Load.up` should subtract one from
@@ -1191,32 +1257,36 @@ class TestLoad:
         assert load.selected == 2
 
     # Tests for Load input.
-    def test_Load_input(self, load):
+    @pt.mark.parametrize('key,cmd', [
+        (DOWN, ('down',)),
+        (UP, ('up',)),
+        ('f', ('file',)),
+        ('x', ('exit',)),
+        ('\n', ('load',)),
+    ])
+    def test_Load_input(self, load, key, cmd):
         """When given input, :meth:`Load.input` should return the expected
         command string.
         """
-        load.term.inkey.side_effect = [DOWN, UP, 'f', 'x', '\n',]
-        assert load.input() == ('down',)
-        assert load.input() == ('up',)
-        assert load.input() == ('file',)
-        assert load.input() == ('exit',)
-        assert load.input() == ('load',)
+        load.term.inkey.return_value = key
+        assert load.input() == cmd
 
     # Tests for Load UI updates.
+    @pt.mark.ui
     def test_Load_update_ui(self, capsys, load, term):
         """When called, :meth:`Load.update_ui` should draw the UI for
         load mode.
         """
         load.update_ui()
         captured = capsys.readouterr()
-        assert repr(captured.out) == repr(
-            term.move(0, 0) + term.on_green + '▸ ..'
-            + term.normal + term.clear_eol + '\n'
-            + term.move(1, 0) + '▸ zeggs' + term.clear_eol + '\n'
-            + term.move(2, 0) + '\u2500' * 4 + '\n'
-            + term.move(3, 0) + load.menu + term.clear_eol
+        assert captured.out == (
+            at(0, 0) + ON_GREEN + '▸ ..'
+            + NORMAL + CLEAR_EOL
+            + at(1, 0) + '▸ zeggs' + CLEAR_EOL
+            + menu_lines(load.menu)
         )
 
+    @pt.mark.ui
     def test_Load_update_ui_scroll_down(self, capsys, load, term):
         """When called, :meth:`Load.update_ui` should draw the UI for
         load mode. If the selected file is below the bottom of the
@@ -1226,12 +1296,11 @@ class TestLoad:
         load.selected = 3
         load.update_ui()
         captured = capsys.readouterr()
-        assert repr(captured.out) == repr(
-            term.move(0, 0) + '.snapshot.txt' + term.clear_eol + '\n'
-            + term.move(1, 0) + term.on_green + 'spam'
-            + term.normal + term.clear_eol + '\n'
-            + term.move(2, 0) + '\u2500' * 4 + '\n'
-            + term.move(3, 0) + load.menu + term.clear_eol
+        assert captured.out == (
+            at(0, 0) + '.snapshot.txt' + CLEAR_EOL
+            + at(1, 0) + ON_GREEN + 'spam'
+            + NORMAL + CLEAR_EOL
+            + menu_lines(load.menu)
         )
 
 
@@ -1265,21 +1334,30 @@ class TestMove:
             assert getattr(obj, attr) == optionals[attr]
 
     # Tests for Move command methods.
-    def test_Move_down(self, move, grid_40, term):
-        """When called with an integer, :meth:`Move.down` should add
-        the integer to the Y origin and return itself.
+    @pt.mark.parametrize('cmd,attr,start,origins', [
+        ('down', 'origin_y', 0, (1, 11, 36)),
+        ('left', 'origin_x', 38, (37, 27, 0)),
+        ('right', 'origin_x', 0, (1, 11, 36)),
+        ('up', 'origin_y', 38, (37, 27, 0)),
+    ])
+    def test_Move_direction(self, move, grid_40, cmd, attr, start, origins):
+        """When called with an integer, the direction methods of
+        :class:`Move` should move the origin by the integer, stopping
+        at the edge of the grid, and return their parent object.
         """
         move.data = grid_40
+        setattr(move, attr, start)
+        method = getattr(move, cmd)
 
-        state = move.down()
+        state = method()
         assert state is move
-        assert state.origin_y == 1
+        assert getattr(state, attr) == origins[0]
 
-        state = move.down(10)
-        assert state.origin_y == 11
+        state = method(10)
+        assert getattr(state, attr) == origins[1]
 
-        state = move.down(35)
-        assert state.origin_y == 36
+        state = method(35)
+        assert getattr(state, attr) == origins[2]
 
     def test_Move_exit(self, move):
         """When called, :meth:`Move.exit` should return a :class:`Core`
@@ -1290,93 +1368,36 @@ class TestMove:
         assert state.data is move.data
         assert state.term is move.term
 
-    def test_Move_left(self, move, grid_40, term):
-        """When called with an integer, :meth:`Move.left` should
-        subtract the integer from the X origin and return itself.
-        """
-        move.data = grid_40
-        move.origin_x = 38
-
-        state = move.left()
-        assert state is move
-        assert state.origin_x == 37
-
-        state = move.left(10)
-        assert state.origin_x == 27
-
-        state = move.left(35)
-        assert state.origin_x == 0
-
-    def test_Move_right(self, move, grid_40, term):
-        """When called with an integer, :meth:`Move.left` should
-        add the integer to the X origin and return itself.
-        """
-        move.data = grid_40
-
-        state = move.right()
-        assert state is move
-        assert state.origin_x == 1
-
-        state = move.right(10)
-        assert state.origin_x == 11
-
-        state = move.right(35)
-        assert state.origin_x == 36
-
-    def test_Move_up(self, move, grid_40, term):
-        """When called with an integer, :meth:`Move.up` should
-        subtract the integer from the X origin and return itself.
-        """
-        move.data = grid_40
-        move.origin_y = 38
-
-        state = move.up()
-        assert state is move
-        assert state.origin_y == 37
-
-        state = move.up(10)
-        assert state.origin_y == 27
-
-        state = move.up(35)
-        assert state.origin_y == 0
-
     # Tests for Move input.
-    def test_Move_input(self, move, term):
+    @pt.mark.parametrize('key,cmd', [
+        (DOWN, ('down', 1)),
+        (SDOWN, ('down', 10)),
+        (LEFT, ('left', 1)),
+        (SLEFT, ('left', 10)),
+        (RIGHT, ('right', 1)),
+        (SRIGHT, ('right', 10)),
+        (UP, ('up', 1)),
+        (SUP, ('up', 10)),
+        ('x', ('exit',)),
+    ])
+    def test_Move_input(self, move, key, cmd):
         """When given input, :meth:`Move.input` should return the expected
         command string.
         """
-        move.term.inkey.side_effect = [
-            DOWN,
-            SDOWN,
-            LEFT,
-            SLEFT,
-            RIGHT,
-            SRIGHT,
-            UP,
-            SUP,
-            'x',
-        ]
-        assert move.input() == ('down', 1)
-        assert move.input() == ('down', 10)
-        assert move.input() == ('left', 1)
-        assert move.input() == ('left', 10)
-        assert move.input() == ('right', 1)
-        assert move.input() == ('right', 10)
-        assert move.input() == ('up', 1)
-        assert move.input() == ('up', 10)
-        assert move.input() == ('exit',)
+        move.term.inkey.side_effect = [key, '']
+        assert move.input() == cmd
 
-    # Tests for Core UI updates.
-    def test_Core_update_ui(self, capsys, move, term):
+    # Tests for Move UI updates.
+    @pt.mark.ui
+    def test_Move_update_ui(self, capsys, move, term):
         """When called, :meth:`Move.update_ui` should redraw the UI
         for the move state.
         """
         move.update_ui()
         captured = capsys.readouterr()
-        assert repr(captured.out) == repr(
+        assert captured.out == (
             grid_start_lines
-            + term.move(2, 0) + '\u2500' * 4 + '\n'
-            + term.move(3, 0) + move.menu + term.clear_eol
+            + menu_lines(move.menu)
         )
 
 
@@ -1389,14 +1410,14 @@ class TestSave:
         save.path = tmp_path
         save.user = 'eggs'
         save.comment = 'bacon'
-        yield save
+        return save
 
     @pt.fixture
     def window_save(self, big_grid, small_term, tmp_path):
         save = sui.Save(big_grid, small_term)
         save.path = tmp_path
         save.user = 'eggs'
-        yield save
+        return save
 
     # Tests for Save initialization.
     def test_Save_init_all_defaults(self, grid, term):
@@ -1412,7 +1433,7 @@ class TestSave:
             'origin_x': 0,
             'origin_y': 0,
         }
-        obj = sui.Start(**required)
+        obj = sui.Save(**required)
         for attr in required:
             assert getattr(obj, attr) is required[attr]
         for attr in optional:
@@ -1429,7 +1450,7 @@ class TestSave:
             'origin_x': 2,
             'origin_y': 3,
         }
-        obj = sui.Start(**optional)
+        obj = sui.Save(**optional)
         for attr in optional:
             assert getattr(obj, attr) == optional[attr]
 
@@ -1453,7 +1474,7 @@ class TestSave:
         assert isinstance(state, sui.Core)
         assert state.data is save.data
         assert state.term is save.term
-        assert repr(saved) == repr(
+        assert saved == (
             '!Name: spam\n'
             '! eggs\n'
             '! B3/S23\n'
@@ -1475,7 +1496,7 @@ class TestSave:
         assert isinstance(state, sui.Core)
         assert state.data is save.data
         assert state.term is save.term
-        assert repr(saved) == repr(
+        assert saved == (
             '#N spam\n'
             '#O eggs\n'
             '#C bacon\n'
@@ -1495,7 +1516,7 @@ class TestSave:
         assert state.term is window_save.term
         assert state.origin_x == window_save.origin_x
         assert state.origin_y == window_save.origin_y
-        assert repr(saved) == repr(
+        assert saved == (
             '!Name: spam\n'
             '! eggs\n'
             '! B3/S23\n'
@@ -1508,6 +1529,7 @@ class TestSave:
         )
 
     # Tests for Save input.
+    @pt.mark.ui
     def test_Save_input(self, capsys, mocker, save, term):
         """When given input, :meth:`Save.input` should return the expected
         command string.
@@ -1516,15 +1538,15 @@ class TestSave:
         cmd = save.input()
         captured = capsys.readouterr()
         assert cmd == ('save', 'spam')
-        assert repr(captured.out) == repr(
-            term.move(4, 0) + '> ' + term.clear_eol
-            + term.move(4, 2)
-            + term.move(4, 2) + 's'
-            + term.move(4, 3) + 'p'
-            + term.move(4, 4) + 'a'
-            + term.move(4, 5) + 'm'
+        assert captured.out == (
+            at(4, 0) + '> ' + CLEAR_EOL
+            + at(4, 2) + 's'
+            + at(4, 3) + 'p'
+            + at(4, 4) + 'a'
+            + at(4, 5) + 'm'
         )
 
+    @pt.mark.ui
     def test_Save_backspace(self, capsys, mocker, save, term):
         """When given input, :meth:`Save.input` should return the expected
         command string. Backspace should delete characters.
@@ -1533,15 +1555,14 @@ class TestSave:
         cmd = save.input()
         captured = capsys.readouterr()
         assert cmd == ('save', 'spam')
-        assert repr(captured.out) == repr(
-            term.move(4, 0) + '> ' + term.clear_eol
-            + term.move(4, 2)
-            + term.move(4, 2) + 's'
-            + term.move(4, 3) + 'p'
-            + term.move(4, 4) + 'a'
-            + term.move(4, 5) + 'a'
-            + term.move(4, 5) + ' '
-            + term.move(4, 5) + 'm'
+        assert captured.out == (
+            at(4, 0) + '> ' + CLEAR_EOL
+            + at(4, 2) + 's'
+            + at(4, 3) + 'p'
+            + at(4, 4) + 'a'
+            + at(4, 5) + 'a'
+            + at(4, 5) + ' '
+            + at(4, 5) + 'm'
         )
 
     def test_Save_escape(self, mocker, save):
@@ -1563,17 +1584,16 @@ class TestSave:
         assert save.input() == ('save', 'tests/spam')
 
     # Tests for Save UI updates.
-    def test_Save_update_ui(self, capsys, mocker, save, term):
+    @pt.mark.ui
+    def test_Save_update_ui(self, capsys, save, term):
         """When called, :meth:`Save.update_ui` should redraw the UI
         for the save state.
         """
-        mocker.patch('pathlib.Path.iterdir', return_value=['spam', 'eggs'])
         save.update_ui()
         captured = capsys.readouterr()
-        assert repr(captured.out) == repr(
+        assert captured.out == (
             grid_start_lines
-            + term.move(2, 0) + '\u2500' * 4 + '\n'
-            + term.move(3, 0) + save.menu + term.clear_eol
+            + menu_lines(save.menu)
         )
 
 
@@ -1660,23 +1680,30 @@ class TestStart:
         assert state.origin_y == window_start.origin_y
 
     # Tests for Start input.
-    def test_Start_input(self, capsys, start, term):
+    def test_Start_input(self, start, term):
         """When valid given input, :meth:`Start.input` should return the
         expected command string.
         """
         start.term.inkey.side_effect = ' '
-        captured = capsys.readouterr()
         assert start.input() == ('run',)
 
     # Tests for Start UI updates.
+    @pt.mark.ui
     def test_Start_update_ui(self, capsys, start, term):
         """When called, :meth:`Start.update_ui` should redraw the UI
         for the start state.
         """
         start.update_ui()
         captured = capsys.readouterr()
-        assert repr(captured.out) == repr(
+        assert captured.out == (
             grid_start_lines
-            + term.move(2, 0) + '\u2500' * 4 + '\n'
-            + term.move(3, 0) + start.menu + term.clear_eol
+            + menu_lines(start.menu)
         )
+
+    @pt.mark.ui
+    def test_Start_update_ui_single_write(self, start, writes):
+        """When called, :meth:`Start.update_ui` should send the whole
+        UI to the terminal in a single write.
+        """
+        start.update_ui()
+        assert len(writes) == 1
@@ -9,23 +9,33 @@ import numpy as np
 from life import util
 
 
+# Common arrays. The inputs are read only, so a test can't change
+# them for the tests that follow.
+data_count = np.arange(16).reshape(4, 4)
+data_count.setflags(write=False)
+data_eye = np.eye(2, dtype=bool)
+data_eye.setflags(write=False)
+data_fitted = np.array([
+    [0x00, 0x01, 0x02, 0x03, 0x00],
+    [0x04, 0x05, 0x06, 0x07, 0x00],
+    [0x08, 0x09, 0x0a, 0x0b, 0x00],
+])
+data_padded = np.array([
+    [0, 0, 0, 0, 0],
+    [0, 1, 0, 0, 0],
+    [0, 0, 1, 0, 0],
+    [0, 0, 0, 0, 0],
+], dtype=bool)
+
+
+# Tests for util.
 def test_fit_array():
     """Given an array and a shape for an array, :func:`util.fit_array`
     should slice and pad the array to fit the new shape without changing
     the relative locations of any of the data within the remaining part
     of the array.
     """
-    a = np.array([
-        [0x00, 0x01, 0x02, 0x03],
-        [0x04, 0x05, 0x06, 0x07],
-        [0x08, 0x09, 0x0a, 0x0b],
-        [0x0c, 0x0d, 0x0e, 0x0f],
-    ])
-    assert (util.fit_array(a, (3, 5), 0) == np.array([
-        [0x00, 0x01, 0x02, 0x03, 0x00],
-        [0x04, 0x05, 0x06, 0x07, 0x00],
-        [0x08, 0x09, 0x0a, 0x0b, 0x00],
-    ])).all()
+    assert np.array_equal(util.fit_array(data_count, (3, 5), 0), data_fitted)
 
 
 def test_max_per_index():
@@ -45,13 +55,4 @@ def test_pad_array():
     and a padding value, :meth:`util.pad_array` should pad the size
     of the given array.
     """
-    a = np.array([
-        [1, 0],
-        [0, 1],
-    ], dtype=bool)
-    assert (util.pad_array(a, (4, 5), 0) == np.array([
-        [0, 0, 0, 0, 0],
-        [0, 1, 0, 0, 0],
-        [0, 0, 1, 0, 0],
-        [0, 0, 0, 0, 0],
-    ], dtype=bool)).all()
+    assert np.array_equal(util.pad_array(data_eye, (4, 5), 0), data_padded)